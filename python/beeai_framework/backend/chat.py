@@ -244,6 +244,12 @@ def _get_chat_model_kwargs_adapter() -> TypeAdapter[ChatModelKwargs]:
     return TypeAdapter(ChatModelKwargs)
 
 
+@functools.cache
+def _resolve_provider_class(provider_id: str) -> type["ChatModel"]:
+    """Resolve a provider id to its ChatModel adapter class (memoized)."""
+    return load_model(provider_id, "chat")
+
+
 class ChatModelResponseConfig(BaseModel):
     force_tool_call_via_response_format: bool = False
     response_format_schema: type[BaseModel] | None = None
@@ -786,7 +792,7 @@ class ChatModel(Runnable[ChatModelOutput]):
             ... )
         """
         parsed_model = parse_model(name)
-        TargetChatModel = load_model(parsed_model.provider_id, "chat")  # type: ignore # noqa: N806
+        TargetChatModel = _resolve_provider_class(parsed_model.provider_id)  # noqa: N806
         if options and isinstance(options, ChatModelParameters):
             kwargs["parameters"] = to_model(ChatModelParameters, options)
         elif options:
@@ -139,6 +139,11 @@ class Message(ABC, Generic[T]):
     def text(self) -> str:
         return "".join([x.text for x in self.get_texts()])
 
+    @property
+    def first_text(self) -> str:
+        """Text of the first text content block (empty string if there is none)."""
+        return next((cont.text for cont in self.content if isinstance(cont, MessageTextContent)), "")
+
     def get_texts(self) -> list[MessageTextContent]:
         return [cont for cont in self.content if isinstance(cont, MessageTextContent)]
 
@@ -1,5 +1,6 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
+from functools import cache
 from importlib import import_module
 from typing import Any, Literal, TypeVar, Union
 
@@ -29,11 +30,17 @@ T = TypeVar("T")
 FullModelName: str
 
 
-def find_provider_def(value: str) -> ProviderDef | None:
+@cache
+def _provider_def_lookup() -> dict[str, ProviderDef]:
+    lookup: dict[str, ProviderDef] = {}
     for provider in BackendProviders.values():
-        if value == provider.name or value == provider.module or value in provider.aliases:
-            return provider
-    return None
+        for key in (provider.name, provider.module, *provider.aliases):
+            lookup.setdefault(key, provider)
+    return lookup
+
+
+def find_provider_def(value: str) -> ProviderDef | None:
+    return _provider_def_lookup().get(value)
 
 
 def parse_model(name: str) -> ProviderModelDef:
@@ -50,6 +50,18 @@ class AbortSignal(BaseModel):
 
         return signal
 
+    async def wait(self) -> None:
+        """Wait until the signal gets aborted."""
+        if self._aborted:
+            return
+
+        event = asyncio.Event()
+        self.add_event_listener(event.set)
+        try:
+            await event.wait()
+        finally:
+            self.remove_event_listener(event.set)
+
     def throw_if_aborted(self) -> None:
         if self._aborted:
             raise AbortError(self.reason)
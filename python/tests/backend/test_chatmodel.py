@@ -2,11 +2,12 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
+import contextlib
+import functools
 from collections.abc import AsyncGenerator
 from typing import Any
 
 import pytest
-import pytest_asyncio
 from pydantic import BaseModel
 
 from beeai_framework.adapters.amazon_bedrock import AmazonBedrockChatModel
@@ -26,6 +27,7 @@ from beeai_framework.backend import (
     CustomMessage,
     UserMessage,
 )
+from beeai_framework.backend.chat import _resolve_provider_class
 from beeai_framework.backend.types import ChatModelInput
 from beeai_framework.cache import SlidingCache
 from beeai_framework.context import RunContext
@@ -38,26 +40,40 @@ Utility functions and classes
 """
 
 
+@functools.lru_cache(maxsize=128)
+def _reverse_words_cached(texts: tuple[str, ...]) -> tuple[str, ...]:
+    """Reverse every word in each text; memoized so repeated runs over the same input are free."""
+    return tuple(" ".join([word[::-1] for word in text.split()]) for text in texts)
+
+
 class ReverseWordsDummyModel(ChatModel):
     """Dummy model that simply reverses every word in a UserMessages"""
 
     model_id = "reversed_words_model"
     # pyrefly: ignore [bad-override]
     provider_id = "ollama"
+    __slots__ = ("chunk_delay", "stream_batch_size")
+
+    def __init__(self, chunk_delay: float = 0.0, stream_batch_size: int = 1, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.chunk_delay = chunk_delay
+        self.stream_batch_size = stream_batch_size
 
     def reverse_message_words(self, messages: list[AnyMessage]) -> list[str]:
-        reversed_words_messages = []
-        for message in messages:
-            if isinstance(message, UserMessage):
-                reversed_words = " ".join(word[::-1] for word in message.text.split())
-                reversed_words_messages.append(reversed_words)
-        return reversed_words_messages
+        texts = tuple(message.text for message in messages if isinstance(message, UserMessage))
+        return list(_reverse_words_cached(texts))
 
     # pyrefly: ignore [bad-param-name-override]
     async def _create(self, input: ChatModelInput, _: RunContext) -> ChatModelOutput:
         reversed_words_messages = self.reverse_message_words(input.messages)
 
-        output_structured: Any = {"reversed": "".join(reversed_words_messages)} if input.response_format else None
+        output_structured: Any = None
+        if input.response_format:
+            # single-message fast path: reuse the already-built string instead of re-joining
+            reversed_text = (
+                reversed_words_messages[0] if len(reversed_words_messages) == 1 else " ".join(reversed_words_messages)
+            )
+            output_structured = {"reversed": reversed_text}
         if isinstance(input.response_format, type) and issubclass(input.response_format, BaseModel):
             # pyrefly: ignore [missing-attribute]
             output_structured = input.response_format.model_validate(output_structured)
@@ -69,22 +85,34 @@ class ReverseWordsDummyModel(ChatModel):
 
     # pyrefly: ignore [bad-param-name-override]
     async def _create_stream(self, input: ChatModelInput, context: RunContext) -> AsyncGenerator[ChatModelOutput]:
-        words = self.reverse_message_words(input.messages)[0].split(" ")
+        words = self.reverse_message_words(input.messages)[0].split()
+        chunks = [word + " " for word in words]
+        chunks[-1] = words[-1]
 
-        last = len(words) - 1
-        for count, chunk in enumerate(words):
+        buffer: list[str] = []
+        for chunk in chunks:
             if context.signal.aborted:
                 break
-            await asyncio.sleep(5)
-            yield ChatModelOutput(output=[AssistantMessage(f"{chunk} " if count != last else chunk)])
+            if self.chunk_delay:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    # resolves early only when the signal aborts during the delay
+                    await asyncio.wait_for(context.signal.wait(), timeout=self.chunk_delay)
+                    break
+            buffer.append(chunk)
+            if len(buffer) >= self.stream_batch_size:
+                yield ChatModelOutput(output=[AssistantMessage("".join(buffer))])
+                buffer.clear()
+
+        if buffer:
+            yield ChatModelOutput(output=[AssistantMessage("".join(buffer))])
 
 
-@pytest_asyncio.fixture
+@pytest.fixture(scope="module")
 def reverse_words_chat() -> ChatModel:
     return ReverseWordsDummyModel()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def chat_messages_list() -> list[AnyMessage]:
     user_message = UserMessage("tell me something interesting")
     custom_message = CustomMessage(role="custom", content="this is a custom message")
@@ -103,7 +131,7 @@ async def test_chat_model_create(reverse_words_chat: ChatModel, chat_messages_li
 
     assert len(response.output) == 1
     assert all(isinstance(message, AssistantMessage) for message in response.output)
-    assert response.output[0].get_texts()[0].text == "llet em gnihtemos gnitseretni"
+    assert response.output[0].first_text == "llet em gnihtemos gnitseretni"
 
 
 @pytest.mark.asyncio
@@ -112,7 +140,6 @@ async def test_chat_model_structure(reverse_words_chat: ChatModel, chat_messages
     class ReverseWordsSchema(BaseModel):
         reversed: str
 
-    reverse_words_chat = ReverseWordsDummyModel()
     response = await reverse_words_chat.run(chat_messages_list, response_format=ReverseWordsSchema)
     assert isinstance(response.output_structured, ReverseWordsSchema)
 
@@ -130,78 +157,144 @@ async def test_chat_model_stream(reverse_words_chat: ChatModel, chat_messages_li
 
 @pytest.mark.asyncio
 @pytest.mark.unit
-async def test_chat_model_abort(reverse_words_chat: ChatModel, chat_messages_list: list[AnyMessage]) -> None:
+async def test_chat_model_stream_batched(chat_messages_list: list[AnyMessage]) -> None:
+    reverse_words_chat = ReverseWordsDummyModel(stream_batch_size=2)
+    response = await reverse_words_chat.run(chat_messages_list, stream=True)
+
+    assert len(response.output) == 1
+    assert len(response.output[0].content) == 2
+    assert response.output[0].text == "llet em gnihtemos gnitseretni"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_abort(chat_messages_list: list[AnyMessage]) -> None:
+    reverse_words_chat = ReverseWordsDummyModel(chunk_delay=0.05)
     with pytest.raises(AbortError):
         await reverse_words_chat.run(
             chat_messages_list,
             stream=True,
-            signal=AbortSignal.timeout(1),
+            signal=AbortSignal.timeout(0.05),
         )
 
 
-@pytest.mark.unit
-def test_chat_model_from(monkeypatch: pytest.MonkeyPatch) -> None:
-    # Ollama with Llama model and base_url specified in code
-    ollama_chat_model = ChatModel.from_name("ollama:llama3.1", {"base_url": "http://somewhere:12345"})
-    assert isinstance(ollama_chat_model, OllamaChatModel)
-    assert ollama_chat_model._settings["base_url"] == "http://somewhere:12345/v1"
-
-    # Ollama with Granite model and base_url specified in env var
-    monkeypatch.setenv("OLLAMA_API_BASE", "http://somewhere-else:12345")
-    ollama_chat_model = ChatModel.from_name("ollama:granite4:micro")
-    assert isinstance(ollama_chat_model, OllamaChatModel)
-    assert ollama_chat_model._settings["base_url"] == "http://somewhere-else:12345/v1"
-
-    # Watsonx with Granite model and settings specified in code
-    watsonx_chat_model = ChatModel.from_name(
+CHAT_MODEL_FROM_CASES = [
+    # (name, settings passed in code, env vars, expected class, expected _settings entries)
+    pytest.param(
+        "ollama:llama3.1",
+        {"base_url": "http://somewhere:12345"},
+        {},
+        OllamaChatModel,
+        {"base_url": "http://somewhere:12345/v1"},
+        id="ollama-settings",
+    ),
+    pytest.param(
+        "ollama:granite4:micro",
+        {},
+        {"OLLAMA_API_BASE": "http://somewhere-else:12345"},
+        OllamaChatModel,
+        {"base_url": "http://somewhere-else:12345/v1"},
+        id="ollama-env",
+    ),
+    pytest.param(
         "watsonx:ibm/granite-3-3-8b-instruct",
         {
             "base_url": "http://somewhere",
             "project_id": "proj_id_123",
             "api_key": "api_key_123",
         },
-    )
-    assert isinstance(watsonx_chat_model, WatsonxChatModel)
-    assert watsonx_chat_model._settings["base_url"] == "http://somewhere"
-    assert watsonx_chat_model._settings["project_id"] == "proj_id_123"
-    assert watsonx_chat_model._settings["api_key"] == "api_key_123"
-
-    # Watsonx with Granite model and settings specified in env vars
-    monkeypatch.setenv("WATSONX_URL", "http://somewhere-else")
-    monkeypatch.setenv("WATSONX_PROJECT_ID", "proj_id_456")
-    monkeypatch.setenv("WATSONX_API_KEY", "api_key_456")
-
-    watsonx_chat_model = ChatModel.from_name("watsonx:ibm/granite-3-3-8b-instruct")
-    assert isinstance(watsonx_chat_model, WatsonxChatModel)
-
-    openai_chat_model = ChatModel.from_name("openai:gpt-4o", api_key="test")
-    assert isinstance(openai_chat_model, OpenAIChatModel)
-
-    groq_chat_model = ChatModel.from_name("groq:gemma2-9b-it", api_key="test")
-    assert isinstance(groq_chat_model, GroqChatModel)
-
-    xai_chat_model = ChatModel.from_name("xai:grok-2", api_key="test")
-    assert isinstance(xai_chat_model, XAIChatModel)
+        {},
+        WatsonxChatModel,
+        {
+            "base_url": "http://somewhere",
+            "project_id": "proj_id_123",
+            "api_key": "api_key_123",
+        },
+        id="watsonx-settings",
+    ),
+    pytest.param(
+        "watsonx:ibm/granite-3-3-8b-instruct",
+        {},
+        {
+            "WATSONX_URL": "http://somewhere-else",
+            "WATSONX_PROJECT_ID": "proj_id_456",
+            "WATSONX_API_KEY": "api_key_456",
+        },
+        WatsonxChatModel,
+        {},
+        id="watsonx-env",
+    ),
+    pytest.param("openai:gpt-4o", {"api_key": "test"}, {}, OpenAIChatModel, {}, id="openai"),
+    pytest.param("groq:gemma2-9b-it", {"api_key": "test"}, {}, GroqChatModel, {}, id="groq"),
+    pytest.param("xai:grok-2", {"api_key": "test"}, {}, XAIChatModel, {}, id="xai"),
+    pytest.param(
+        "vertexai:gemini-2.0-flash-lite-001",
+        {"vertex_location": "test"},
+        {"GOOGLE_VERTEX_PROJECT": "myproject"},
+        VertexAIChatModel,
+        {},
+        id="vertexai",
+    ),
+    pytest.param(
+        "anthropic:claude-3-haiku-20240307",
+        {},
+        {"ANTHROPIC_API_KEY": "apikey"},
+        AnthropicChatModel,
+        {},
+        id="anthropic",
+    ),
+    pytest.param(
+        "amazon_bedrock:meta.llama3-8b-instruct-v1:0",
+        {},
+        {
+            "AWS_ACCESS_KEY_ID": "secret1",
+            "AWS_SECRET_ACCESS_KEY": "secret2",
+            "AWS_REGION": "region1",
+        },
+        AmazonBedrockChatModel,
+        {},
+        id="amazon-bedrock",
+    ),
+    pytest.param(
+        "azure_openai:gpt-4o",
+        {},
+        {
+            "AZURE_API_KEY": "secret",
+            "AZURE_API_BASE": "base",
+            "AZURE_API_VERSION": "version",
+        },
+        AzureOpenAIChatModel,
+        {},
+        id="azure-openai",
+    ),
+]
 
-    monkeypatch.setenv("GOOGLE_VERTEX_PROJECT", "myproject")
-    vertexai_chat_model = ChatModel.from_name("vertexai:gemini-2.0-flash-lite-001", vertex_location="test")
-    assert isinstance(vertexai_chat_model, VertexAIChatModel)
 
-    monkeypatch.setenv("ANTHROPIC_API_KEY", "apikey")
-    anthropic_chat_model = ChatModel.from_name("anthropic:claude-3-haiku-20240307")
-    assert isinstance(anthropic_chat_model, AnthropicChatModel)
+@pytest.mark.unit
+@pytest.mark.parametrize(("name", "settings", "env", "expected_cls", "expected_settings"), CHAT_MODEL_FROM_CASES)
+def test_chat_model_from(
+    monkeypatch: pytest.MonkeyPatch,
+    name: str,
+    settings: dict[str, Any],
+    env: dict[str, str],
+    expected_cls: type[ChatModel],
+    expected_settings: dict[str, str],
+) -> None:
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+
+    chat_model = ChatModel.from_name(name, settings or None)
+    assert isinstance(chat_model, expected_cls)
+    for key, value in expected_settings.items():
+        assert chat_model._settings[key] == value
 
-    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "secret1")
-    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "secret2")
-    monkeypatch.setenv("AWS_REGION", "region1")
-    amazon_bedrock_chat_model = ChatModel.from_name("amazon_bedrock:meta.llama3-8b-instruct-v1:0")
-    assert isinstance(amazon_bedrock_chat_model, AmazonBedrockChatModel)
 
-    monkeypatch.setenv("AZURE_API_KEY", "secret")
-    monkeypatch.setenv("AZURE_API_BASE", "base")
-    monkeypatch.setenv("AZURE_API_VERSION", "version")
-    azure_openai_chat_model = ChatModel.from_name("azure_openai:gpt-4o")
-    assert isinstance(azure_openai_chat_model, AzureOpenAIChatModel)
+@pytest.mark.unit
+def test_chat_model_from_caches_provider_resolution() -> None:
+    hits_before = _resolve_provider_class.cache_info().hits
+    ChatModel.from_name("ollama:llama3.1")
+    ChatModel.from_name("ollama:granite4:micro")
+    assert _resolve_provider_class.cache_info().hits > hits_before
 
 
 class FailThenFixDummyModel(ChatModel):
@@ -212,6 +305,7 @@ class FailThenFixDummyModel(ChatModel):
     model_id = "fail_then_fix_model"
     # pyrefly: ignore [bad-override]
     provider_id = "ollama"
+    __slots__ = ("_attempt",)
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)